@@ -1433,10 +1433,14 @@ final class BLEManager: NSObject, ObservableObject {
         }
     }
     
-    private func formattedTime() -> String {
+    /// 日志时间戳格式化器只创建一次；每条日志都会调用，避免反复构造 DateFormatter
+    private static let logTimeFormatter: DateFormatter = {
         let f = DateFormatter()
         f.dateFormat = "HH:mm:ss.SSS"
-        return f.string(from: Date())
+        return f
+    }()
+    private func formattedTime() -> String {
+        Self.logTimeFormatter.string(from: Date())
     }
     
     /// OTA 时间格式 MM:SS（与 OTASectionView 一致）